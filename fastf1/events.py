@@ -1,10 +1,15 @@
 import collections
 import datetime
+import hashlib
 import json
+import os
+import pickle
+import re
+import time
 import warnings
+from types import MappingProxyType
 from typing import Literal
 
-import dateutil.parser
 import pandas as pd
 
 import fastf1._api
@@ -22,7 +27,6 @@ from fastf1.logger import (
 )
 from fastf1.req import Cache
 from fastf1.utils import (
-    recursive_dict_get,
     to_datetime,
     to_timedelta
 )
@@ -30,7 +34,7 @@ from fastf1.utils import (
 
 _logger = get_logger(__name__)
 
-_SESSION_TYPE_ABBREVIATIONS = {
+_SESSION_TYPE_ABBREVIATIONS = MappingProxyType({
     'R': 'Race',
     'Q': 'Qualifying',
     'S': 'Sprint',
@@ -39,12 +43,31 @@ _SESSION_TYPE_ABBREVIATIONS = {
     'FP1': 'Practice 1',
     'FP2': 'Practice 2',
     'FP3': 'Practice 3'
-}
+})
+
+# full session names by casefolded session name or abbreviation
+_SESSION_NAME_LOOKUP = MappingProxyType({
+    **{name.casefold(): name for name in _SESSION_TYPE_ABBREVIATIONS.values()},
+    **{abbreviation.casefold(): name
+       for abbreviation, name in _SESSION_TYPE_ABBREVIATIONS.items()}
+})
+
+# column names of session name, local date and UTC date for each session
+_SESSION_COLUMNS = tuple(
+    (f'Session{n}', f'Session{n}Date', f'Session{n}DateUtc')
+    for n in range(1, 6)
+)
 
 _SCHEDULE_BASE_URL = "https://raw.githubusercontent.com/" \
                      "theOehrly/f1schedule/master/"
 _HEADERS = {'User-Agent': f'FastF1/{__version_short__}'}
 
+# in-memory storage for recently loaded event schedules, see
+# _get_schedule_memoized
+_SCHEDULE_MEMO_SIZE = 8
+_SCHEDULE_MEMO_EXPIRE = 12 * 60 * 60  # seconds, maximum age of an entry
+_schedule_memo: collections.OrderedDict = collections.OrderedDict()
+
 
 def get_session(
         year: int,
@@ -210,9 +233,11 @@ def get_event(
 
     .. versionadded:: 2.2
     """
-    schedule = get_event_schedule(year=year, include_testing=False,
-                                  force_ergast=force_ergast,
-                                  backend=backend)
+    # the lookup is done on the shared schedule, so that the lookup tables
+    # of the schedule are reused by repeated calls for the same season
+    schedule = _get_event_schedule(year, include_testing=False,
+                                   force_ergast=force_ergast,
+                                   backend=backend)
 
     if isinstance(gp, str):
         event = schedule.get_event_by_name(
@@ -252,7 +277,8 @@ def get_testing_event(
     if backend == 'ergast':
         raise ValueError("The 'ergast' backend does not support "
                          "testing events!")
-    schedule = get_event_schedule(year=year, backend=backend)
+    schedule = _get_event_schedule(year, include_testing=True,
+                                   force_ergast=False, backend=backend)
     schedule = schedule[schedule.is_testing()]
 
     try:
@@ -302,6 +328,20 @@ def get_event_schedule(
     .. versionadded:: 2.2
 
     """
+    schedule = _get_event_schedule(year, include_testing=include_testing,
+                                   force_ergast=force_ergast, backend=backend)
+    return schedule.copy()
+
+
+def _get_event_schedule(
+        year: int,
+        *,
+        include_testing: bool,
+        backend: Literal['fastf1', 'f1timing', 'ergast'] | None,
+        force_ergast: bool
+) -> "EventSchedule":
+    # Returns the event schedule for a season. The returned object can be
+    # shared between calls, it must not be modified or returned to the user!
     if force_ergast:
         warnings.warn("Option ``force_ergast`` has been deprecated, use"
                       "``backend='ergast'`` instead")
@@ -322,15 +362,16 @@ def get_event_schedule(
 
     schedule = None
     for func in _backends:
-        schedule = func(year)
+        schedule = _get_schedule_memoized(func, year)
         if schedule is not None:
             break
 
     if schedule is None:  # raise Error if fallback failed as well
         raise ValueError("Failed to load any schedule data.")
+    schedule._store_lookup_tables = True
 
     if not include_testing:
-        schedule = schedule[~schedule.is_testing()]
+        schedule = schedule._get_without_testing()
     return schedule
 
 
@@ -400,6 +441,57 @@ def get_events_remaining(
     return result
 
 
+def _get_schedule_memoized(func, year) -> "EventSchedule | None":
+    # Keep recently loaded schedules in memory so that repeated calls for the
+    # same season do not need to request and parse the schedule again.
+    # Failed loads are not stored and the memo is bypassed if caching is
+    # disabled, a cache renewal is forced or in CI mode, so that the backend
+    # is always executed then. Entries expire together with the cached
+    # response that the schedule was created from, if this is known, but
+    # after _SCHEDULE_MEMO_EXPIRE at the latest. The memo is emptied when
+    # the cache is cleared.
+    # The returned schedule is shared, it must not be modified!
+    if Cache._tmp_disabled or Cache._ci_mode or Cache._FORCE_RENEW:
+        return func(year)
+
+    key = (func.__name__, year)
+    now = time.monotonic()
+    if key in _schedule_memo:
+        expiry, schedule = _schedule_memo[key]
+        if now < expiry:
+            _schedule_memo.move_to_end(key)
+            return schedule
+        del _schedule_memo[key]
+
+    schedule = func(year)
+    if schedule is None:
+        return None
+
+    expiry = now + _SCHEDULE_MEMO_EXPIRE
+    if schedule._source_expiry is not None:
+        expiry = min(expiry, schedule._source_expiry)
+    _schedule_memo[key] = (expiry, schedule)
+    if len(_schedule_memo) > _SCHEDULE_MEMO_SIZE:
+        _schedule_memo.popitem(last=False)
+    return schedule
+
+
+def _clear_schedule_memo():
+    _schedule_memo.clear()
+
+
+Cache._memory_cache_clear_funcs.append(_clear_schedule_memo)
+
+
+def _get_response_expiry(response) -> float | None:
+    # time.monotonic() value at which a response that was returned from the
+    # requests cache expires, None if it is unknown
+    expires_delta = getattr(response, 'expires_delta', None)
+    if not getattr(response, 'from_cache', False) or expires_delta is None:
+        return None
+    return time.monotonic() + expires_delta
+
+
 @soft_exceptions("FastF1 schedule",
                  "Failed to load schedule from FastF1 backend!",
                  _logger)
@@ -408,55 +500,94 @@ def _get_schedule_ff1(year):
         _SCHEDULE_BASE_URL + f"schedule_{year}.json",
         headers=_HEADERS
     )
+    source_expiry = _get_response_expiry(response)
+
+    # reuse the parsed schedule from the stage 2 cache if it was created
+    # from the same response content
+    cache_file_path = _get_schedule_cache_path(year)
+    if cache_file_path is not None:
+        content_hash = hashlib.sha1(response.content).hexdigest()
+        schedule = _read_schedule_cache(cache_file_path, content_hash)
+        if schedule is not None:
+            schedule._source_expiry = source_expiry
+            return schedule
 
+    # the raw response content is parsed directly, the columns are stored
+    # as {column: {row: value}}; column names are changed from snake_case to
+    # UpperCamelCase
     data = dict()
-    json_data = json.loads(response.text)
+    json_data = json.loads(response.content)
     for key in json_data.keys():
-        data[key] = list(json_data[key].values())
+        col = ''.join([s.capitalize() for s in key.split('_')])
+        data[col] = list(json_data[key].values())
 
     # convert gmt offset to timedelta
     gmt_offset = list()
-    for go in data.pop('gmt_offset'):
+    for go in data.pop('GmtOffset'):
         if go is None:
             gmt_offset.append(datetime.timedelta(0))
         else:
             # hh:mm -> hh:mm:00 before to_timedelta
             gmt_offset.append(to_timedelta(f"{go}:00"))
+    utc_offset = pd.TimedeltaIndex(gmt_offset)
 
-    length = len(gmt_offset)
+    # convert and set all timestamps; all timestamps of a column are parsed
+    # at once and UTC timestamps are calculated for all events at once
+    data['EventDate'] = pd.to_datetime(
+        data['EventDate'], format='ISO8601', errors='coerce'
+    ).floor('D')
 
-    # create additional columns for UTC timestamps
-    for n in range(5):
-        data[f'session{n+1}_date_Utc'] = [None, ] * length
+    for n in range(1, 6):
+        dates = pd.to_datetime(
+            data[f'Session{n}Date'], format='ISO8601', errors='coerce'
+        )
+        # create non-tz-aware utc time
+        data[f'Session{n}DateUtc'] = dates - utc_offset
+        # create tz-aware local time
+        data[f'Session{n}Date'] = [
+            pd.NaT if date is pd.NaT
+            else date.replace(tzinfo=datetime.timezone(offset))
+            for date, offset in zip(dates, gmt_offset)
+        ]
 
-    # convert and set all timestamps
-    for i in range(length):
-        data['event_date'][i] = to_datetime(data['event_date'][i]) \
-            .replace(hour=0, minute=0, second=0)
+    schedule = EventSchedule(data, year=year, _force_default_cols=True)
 
-        for j in range(5):
-            date = to_datetime(data[f'session{j+1}_date'][i])
-            if date is None:
-                date_utc = None
-            else:
-                # create tz-aware local time
-                date = date.replace(tzinfo=datetime.timezone(gmt_offset[i]))
+    if cache_file_path is not None:
+        Cache._write_cache(schedule, cache_file_path,
+                           content_hash=content_hash)
+    schedule._source_expiry = source_expiry
+    return schedule
 
-                # create non-tz-aware utc time
-                date_utc = date.astimezone(datetime.timezone.utc) \
-                    .replace(tzinfo=None)
 
-            data[f'session{j+1}_date'][i] = pd.Timestamp(date)
-            data[f'session{j+1}_date_Utc'][i] = pd.Timestamp(date_utc)
+def _get_schedule_cache_path(year):
+    # path of the stage 2 cache file for a parsed schedule, None if the
+    # stage 2 cache is not used (skipped in CI mode so that the parser code
+    # is always executed)
+    if (not Cache._CACHE_DIR) or Cache._tmp_disabled or Cache._ci_mode:
+        return None
+    cache_dir_path = os.path.join(Cache._CACHE_DIR, str(year))
+    os.makedirs(cache_dir_path, exist_ok=True)
+    return os.path.join(cache_dir_path, 'event_schedule.ff1pkl')
 
-    df = pd.DataFrame(data)
-    # change column names from snake_case to UpperCamelCase
-    col_renames = {col: ''.join([s.capitalize() for s in col.split('_')])
-                   for col in df.columns}
-    df = df.rename(columns=col_renames)
 
-    schedule = EventSchedule(df, year=year, _force_default_cols=True)
-    return schedule
+def _read_schedule_cache(cache_file_path, content_hash):
+    # load a parsed schedule from the stage 2 cache, None if it does not
+    # exist, cannot be loaded or is outdated
+    if not os.path.isfile(cache_file_path):
+        return None
+    try:
+        with open(cache_file_path, 'rb') as cache_file_obj:
+            cached = pickle.load(cache_file_obj)
+    except:  # noqa: E722 (bare except)
+        # same as for the api cache, any exception means that the cached
+        # data cannot be used
+        return None
+
+    if (not Cache._data_ok_for_use(cached)) \
+            or (cached.get('content_hash') != content_hash):
+        return None
+    _logger.info("Using cached data for event schedule")
+    return cached['data']
 
 
 @soft_exceptions("F1 API schedule",
@@ -552,86 +683,60 @@ def _get_schedule_from_f1_timing(year: int):
 def _get_schedule_from_ergast(year) -> "EventSchedule":
     # create an event schedule using data from the ergast database
     season = fastf1.ergast.fetch_season(year)
-    data = collections.defaultdict(list)
-    for rnd in season:
-        data['RoundNumber'].append(int(rnd.get('round')))
-        data['Country'].append(
-            recursive_dict_get(rnd, 'Circuit', 'Location', 'country')
-        )
-        data['Location'].append(
-            recursive_dict_get(rnd, 'Circuit', 'Location', 'locality')
-        )
-        data['EventName'].append(rnd.get('raceName'))
-        data['OfficialEventName'].append("")
-
-        try:
-            date = pd.to_datetime(
-                f"{rnd.get('date', '')}T{rnd.get('time', '')}",
-            ).tz_localize(None)
-        except dateutil.parser.ParserError:
-            date = pd.Timestamp(pd.NaT)
-        data['EventDate'].append(date)
-
-        if 'Sprint' in rnd:
-            # Ergast doesn't support sprint shootout format yet
-            if year in (2021, 2022):
-                _format = 'sprint'
-                session_names = ['Practice 1', 'Qualifying', 'Practice 2',
-                                 'Sprint', 'Race']
-            elif year == 2023:
-                _format = 'sprint_shootout'
-                session_names = ['Practice 1', 'Qualifying', 'Sprint Shootout',
-                                 'Sprint', 'Race']
-            else:
-                _format = 'sprint_qualifying'
-                session_names = ['Practice 1', 'Sprint Qualifying', 'Sprint',
-                                 'Qualifying', 'Race']
-
-            data['EventFormat'].append(_format)
-
-            data['Session1'].append(session_names[0])
-            data['Session1DateUtc'].append(
-                date.floor('D') - pd.Timedelta(days=2))
-
-            data['Session2'].append(session_names[1])
-            data['Session2DateUtc'].append(
-                date.floor('D') - pd.Timedelta(days=2))
-
-            data['Session3'].append(session_names[2])
-            data['Session3DateUtc'].append(
-                date.floor('D') - pd.Timedelta(days=1))
-
-            data['Session4'].append(session_names[3])
-            data['Session4DateUtc'].append(
-                date.floor('D') - pd.Timedelta(days=1))
-
-            data['Session5'].append(session_names[4])
-            data['Session5DateUtc'].append(date)
-
-        else:
-            data['EventFormat'].append("conventional")
 
-            data['Session1'].append('Practice 1')
-            data['Session1DateUtc'].append(
-                date.floor('D') - pd.Timedelta(days=2))
-
-            data['Session2'].append('Practice 2')
-            data['Session2DateUtc'].append(
-                date.floor('D') - pd.Timedelta(days=2))
-
-            data['Session3'].append('Practice 3')
-            data['Session3DateUtc'].append(
-                date.floor('D') - pd.Timedelta(days=1))
-
-            data['Session4'].append('Qualifying')
-            data['Session4DateUtc'].append(
-                date.floor('D') - pd.Timedelta(days=1))
+    # Ergast doesn't support sprint shootout format yet
+    if year in (2021, 2022):
+        sprint_format = 'sprint'
+        sprint_session_names = ('Practice 1', 'Qualifying', 'Practice 2',
+                                'Sprint', 'Race')
+    elif year == 2023:
+        sprint_format = 'sprint_shootout'
+        sprint_session_names = ('Practice 1', 'Qualifying', 'Sprint Shootout',
+                                'Sprint', 'Race')
+    else:
+        sprint_format = 'sprint_qualifying'
+        sprint_session_names = ('Practice 1', 'Sprint Qualifying', 'Sprint',
+                                'Qualifying', 'Race')
+    conventional_session_names = ('Practice 1', 'Practice 2', 'Practice 3',
+                                  'Qualifying', 'Race')
+
+    # all event dates are parsed at once, the time is optional;
+    # invalid or missing dates are set to NaT
+    event_dates = pd.to_datetime(
+        [f"{rnd.get('date', '')}T{rnd['time']}" if rnd.get('time')
+         else rnd.get('date', '') for rnd in season],
+        format='ISO8601', utc=True, errors='coerce'
+    ).tz_localize(None).astype('datetime64[ns]')
+
+    locations = [rnd.get('Circuit', {}).get('Location', {}) for rnd in season]
+    is_sprint = ['Sprint' in rnd for rnd in season]
+    session_names = [sprint_session_names if sprint
+                     else conventional_session_names
+                     for sprint in is_sprint]
+
+    # all columns are created at once from the whole season, session dates
+    # are calculated for all events at once from the event dates
+    data = {
+        'RoundNumber': [int(rnd.get('round')) for rnd in season],
+        'Country': [loc.get('country') for loc in locations],
+        'Location': [loc.get('locality') for loc in locations],
+        'EventName': [rnd.get('raceName') for rnd in season],
+        'OfficialEventName': [""] * len(season),
+        'EventDate': event_dates,
+        'EventFormat': [sprint_format if sprint else "conventional"
+                        for sprint in is_sprint],
+    }
 
-            data['Session5'].append('Race')
-            data['Session5DateUtc'].append(date)
+    event_days = event_dates.floor('D')
+    for i, days_before in enumerate((2, 2, 1, 1)):
+        data[f'Session{i+1}'] = [names[i] for names in session_names]
+        data[f'Session{i+1}DateUtc'] \
+            = event_days - pd.Timedelta(days=days_before)
+    data['Session5'] = [names[4] for names in session_names]
+    data['Session5DateUtc'] = event_dates
 
-        data['F1ApiSupport'].append(True if year >= 2018 else False)
-        # simplified; this is only true most of the time
+    # simplified; this is only true most of the time
+    data['F1ApiSupport'] = [year >= 2018] * len(season)
 
     df = pd.DataFrame(data)
     schedule = EventSchedule(df, year=year, _force_default_cols=True)
@@ -684,6 +789,28 @@ class EventSchedule(BaseDataFrame):
     }
 
     _metadata = ['year']
+    _internal_names = BaseDataFrame._internal_names \
+        + ['_store_lookup_tables', '_round_index', '_matcher_strings',
+           '_without_testing', '_common_words_regex', '_source_expiry']
+    _internal_names_set = set(_internal_names)
+
+    # Lookup tables are only stored on the schedules that are shared
+    # internally and never modified (see ``_get_event_schedule``). A schedule
+    # that is returned to the user may be modified in place, which would
+    # leave stored lookup tables outdated, so they are created on each use.
+    _store_lookup_tables: bool = False
+    # maps round numbers to row positions, created on first use
+    _round_index: dict[int, int] | None = None
+    # feature strings of each event for fuzzy matching, created on first use
+    _matcher_strings: list[list[str]] | None = None
+    # schedule without testing events, created on first use
+    _without_testing: "EventSchedule | None" = None
+    # year and pattern matching all common words of event names for this
+    # year, created on first use
+    _common_words_regex: tuple[int, re.Pattern] | None = None
+    # time.monotonic() value at which the cached response that this schedule
+    # was created from expires, None if unknown
+    _source_expiry: float | None = None
 
     def __init__(self, *args, year: int = 0, **kwargs):
 
@@ -699,6 +826,16 @@ class EventSchedule(BaseDataFrame):
         testing event."""
         return pd.Series(self['EventFormat'] == 'testing')
 
+    def _get_without_testing(self) -> "EventSchedule":
+        # the schedule is stored, so that its own lookup tables are reused
+        if self._without_testing is not None:
+            return self._without_testing
+        schedule = self[~self.is_testing()]
+        if self._store_lookup_tables:
+            schedule._store_lookup_tables = True
+            self._without_testing = schedule
+        return schedule
+
     def get_event_by_round(self, round: int) -> "Event":
         """Get an :class:`Event` by its round number.
 
@@ -709,51 +846,90 @@ class EventSchedule(BaseDataFrame):
         """
         if round == 0:
             raise ValueError("Cannot get testing event by round number!")
-        mask = self['RoundNumber'] == round
-        if not mask.any():
+
+        round_index = self._round_index
+        if round_index is None:
+            round_index = dict()
+            for pos, rnd in enumerate(self['RoundNumber'].to_list()):
+                # keep the first row if a round number is not unique
+                round_index.setdefault(rnd, pos)
+            if self._store_lookup_tables:
+                self._round_index = round_index
+
+        try:
+            pos = round_index[round]
+        except KeyError:
             raise ValueError(f"Invalid round: {round}")
-        return self[mask].iloc[0]
+        return self.iloc[pos]
 
     def _strict_event_search(self, name: str):
         """
         Match Event Name exactly, ignoring case.
         """
-
-        query = name.lower()
-        for i, event in self.iterrows():
-            if 'EventName' in event:
-                if event['EventName'].lower() == query:
-                    return self.loc[i]
-        else:
+        if 'EventName' not in self.columns:
             return None
 
-    def _fuzzy_event_search(self, name: str) -> "Event":
-
-        def _remove_common_words(event_name):
-            common_words = ["formula 1", str(self.year), "grand prix", "gp"]
-            event_name = event_name.casefold()
-
-            for word in common_words:
-                event_name = event_name.replace(word, "")
-
-            return event_name
+        mask = self['EventName'].str.lower() == name.lower()
+        if not mask.any():
+            return None
+        return self[mask].iloc[0]
 
-        def _matcher_strings(ev):
-            strings = list()
-            if ('Location' in ev) and ev['Location']:
-                strings.append(ev['Location'].casefold())
-            if ('Country' in ev) and ev['Country']:
-                strings.append(ev['Country'].casefold())
-            if ('EventName' in ev) and ev['EventName']:
-                strings.append(_remove_common_words(ev["EventName"]))
-            if ('OfficialEventName' in ev) and ev['OfficialEventName']:
-                strings.append(_remove_common_words(ev["OfficialEventName"]))
-            return strings
+    def _common_words_pattern(self) -> re.Pattern:
+        # words that are removed from event names before fuzzy matching; the
+        # pattern is created on first use and not in __init__, because the
+        # year is only set after __init__ when a schedule is sliced, and it is
+        # created again if the year has been changed since
+        if (self._common_words_regex is None
+                or self._common_words_regex[0] != self.year):
+            words = ("formula 1", str(self.year), "grand prix", "gp")
+            self._common_words_regex = (self.year, re.compile(
+                '|'.join(re.escape(word) for word in words)
+            ))
+        return self._common_words_regex[1]
+
+    def _remove_common_words(self, event_name: str) -> str:
+        return self._common_words_pattern().sub("", event_name.casefold())
+
+    def _get_matcher_strings(self) -> list[list[str]]:
+        # Create the feature strings for all events column by column instead
+        # of iterating over the rows; empty values are not used as features.
+        # The feature strings are only created once for schedules that store
+        # lookup tables, a new list is returned each time as the fuzzy matcher
+        # modifies it in place.
+        if self._matcher_strings is not None:
+            return [list(strings) for strings in self._matcher_strings]
+
+        feature_columns = list()
+        for col, remove_words in (('Location', False),
+                                  ('Country', False),
+                                  ('EventName', True),
+                                  ('OfficialEventName', True)):
+            if col not in self.columns:
+                continue
+            values = self[col]
+            strings = values.str.casefold()
+            if remove_words:
+                strings = strings.str.replace(
+                    self._common_words_pattern(), "", regex=True
+                )
+            feature_columns.append(
+                strings.where(values.astype(bool), None).to_list()
+            )
+
+        matcher_strings = [
+            [string for string in feature_strings if string is not None]
+            for feature_strings in zip(*feature_columns)
+        ]
+        if not self._store_lookup_tables:
+            return matcher_strings
+
+        self._matcher_strings = matcher_strings
+        return [list(strings) for strings in self._matcher_strings]
 
+    def _fuzzy_event_search(self, name: str) -> "Event":
         user_input = name
-        name = _remove_common_words(name)
-
-        reference = [_matcher_strings(event) for _, event in self.iterrows()]
+        name = self._remove_common_words(name)
+        reference = self._get_matcher_strings()
 
         index, exact = fuzzy_matcher(name, reference)
         event = self.iloc[index]
@@ -859,21 +1035,13 @@ class Event(BaseSeries):
         Raises:
             ValueError: No matching session or invalid identifier
         """
-        try:
-            num = float(identifier)
-        except ValueError:
-            # by name or abbreviation
-            for name in _SESSION_TYPE_ABBREVIATIONS.values():
-                if identifier.casefold() == name.casefold():
-                    session_name = name
-                    break
-            else:
-                try:
-                    session_name = \
-                        _SESSION_TYPE_ABBREVIATIONS[identifier.upper()]
-                except KeyError:
-                    raise ValueError(f"Invalid session type '{identifier}'")
+        # by name or abbreviation; this is checked first so that no exception
+        # needs to be raised and caught for the common case of a valid name
+        session_name = None
+        if isinstance(identifier, str):
+            session_name = _SESSION_NAME_LOOKUP.get(identifier.casefold())
 
+        if session_name is not None:
             # 'Sprint' was originally called 'Sprint Qualifying' only in the
             # old 'sprint' event format and renamed later; support the old
             # name for backwards compatibility by silently correcting to the
@@ -882,12 +1050,19 @@ class Event(BaseSeries):
                     and (self.year in (2021, 2022))):
                 session_name = 'Sprint'
 
-            if session_name not in self.values:
+            # only the session name columns need to be checked
+            if session_name not in [self[name_col]
+                                    for name_col, _, _ in _SESSION_COLUMNS]:
                 raise ValueError(f"Session type '{identifier}' does not "
                                  f"exist for this event")
         else:
-            # by number
-            if (float(num).is_integer()
+            # by number (also numeric strings)
+            try:
+                num = float(identifier)
+            except ValueError:
+                raise ValueError(f"Invalid session type '{identifier}'") \
+                    from None
+            if (num.is_integer()
                     and (num := int(num)) in (1, 2, 3, 4, 5)):
                 session_name = self[f'Session{num}']
             else:
@@ -912,21 +1087,20 @@ class Event(BaseSeries):
             ValueError: No matching session or invalid identifier
         """
         session_name = self.get_session_name(identifier)
-        relevant_columns = self.loc[['Session1', 'Session2', 'Session3',
-                                     'Session4', 'Session5']]
-        mask = (relevant_columns == session_name)
-        if not mask.any():
+        for name_col, date_col, date_utc_col in _SESSION_COLUMNS:
+            if self[name_col] == session_name:
+                break
+        else:
             raise ValueError(f"Session type '{identifier}' does not exist "
                              f"for this event")
-        else:
-            _name = mask.idxmax()
-            date_utc = self[f"{_name}DateUtc"]
-            date = self[f"{_name}Date"]
-            if (not utc) and pd.isnull(date) and (not pd.isnull(date_utc)):
-                raise ValueError("Local timestamp is not available")
-            if utc:
-                return date_utc
-            return date
+
+        date_utc = self[date_utc_col]
+        date = self[date_col]
+        if (not utc) and pd.isnull(date) and (not pd.isnull(date_utc)):
+            raise ValueError("Local timestamp is not available")
+        if utc:
+            return date_utc
+        return date
 
     def get_session(self, identifier: int | str) -> "Session":
         """Return a session from this event.
@@ -939,25 +1113,8 @@ class Event(BaseSeries):
         Raises:
             ValueError: No matching session or invalid identifier
         """
-        try:
-            num = float(identifier)
-        except ValueError:
-            # by name or abbreviation
-            session_name = self.get_session_name(identifier)
-            if session_name not in self.values:
-                raise ValueError(f"Session type '{identifier}' does not "
-                                 f"exist for this event")
-        else:
-            # by number
-            if (float(num).is_integer()
-                    and (num := int(num)) in (1, 2, 3, 4, 5)):
-                session_name = self[f'Session{num}']
-            else:
-                raise ValueError(f"Invalid session type '{num}'")
-            if not session_name:
-                raise ValueError(f"Session number {num} does not "
-                                 f"exist for this event")
-
+        # validates that the session exists for this event
+        session_name = self.get_session_name(identifier)
         return Session(event=self, session_name=session_name,
                        f1_api_support=self.F1ApiSupport)
 
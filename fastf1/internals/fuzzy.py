@@ -1,15 +1,8 @@
-import warnings
-
 import numpy as np
-
-
-with warnings.catch_warnings():
-    warnings.filterwarnings(
-        'ignore', message="Using slow pure-python SequenceMatcher"
-    )
-    # suppress that warning, it's confusing at best here, we don't need fast
-    # sequence matching and the installation (on windows) requires some effort
-    from rapidfuzz import fuzz
+from rapidfuzz import (
+    fuzz,
+    process
+)
 
 
 def fuzzy_matcher(
@@ -28,12 +21,13 @@ def fuzzy_matcher(
     function tries to find the best matching element in the reference list
     for the given query string.
 
-    The function first checks for exact substring matches with the individual
-    feature strings. If there is exactly one sub-list, where the query
-    is a substring of a feature string, this index is returned as an
-    "accurate match". Else, the function uses fuzzy string matching to find the
-    best match in the reference list. The index of the best matching element is
-    then returned as an "inaccurate match".
+    The function first checks for exact matches and then for exact substring
+    matches with the individual feature strings. If there is exactly one
+    sub-list, where the query is equal to a feature string, or exactly one
+    sub-list, where the query is a substring of a feature string, this index
+    is returned as an "accurate match". Else, the function uses fuzzy string
+    matching to find the best match in the reference list. The index of the
+    best matching element is then returned as an "inaccurate match".
 
     Args:
         query: The query string to match.
@@ -62,14 +56,24 @@ def fuzzy_matcher(
         for j in range(len(reference[i])):
             reference[i][j] = reference[i][j].casefold().replace(" ", "")
 
-    # Check for exact substring matches with the individual feature strings
-    # first. If there is exactly one reference tuple, where the query is a
-    # substring of a feature string, return this index as accurate match.
+    # Check for exact matches and exact substring matches with the individual
+    # feature strings first. If there is exactly one reference tuple, where
+    # the query is equal to a feature string, or exactly one reference tuple,
+    # where the query is a substring of a feature string, return this index as
+    # accurate match. (A unique exact match would also be the best fuzzy
+    # match, so the fuzzy matching can be skipped for it.)
+    full_match_indices = []
     full_partial_match_indices = []
     for i, feature_strings in enumerate(reference):
+        if query in feature_strings:
+            full_match_indices.append(i)
         if any([query in val for val in feature_strings]):
             full_partial_match_indices.append(i)
 
+    if len(full_match_indices) == 1:
+        # return index as accurate match
+        return full_match_indices[0], True
+
     if len(full_partial_match_indices) == 1:
         # return index as accurate match
         return full_partial_match_indices[0], True
@@ -84,12 +88,16 @@ def fuzzy_matcher(
     if full_partial_match_indices:
         candidate_indices = full_partial_match_indices
     else:
-        candidate_indices = range(len(reference))
+        candidate_indices = list(range(len(reference)))
 
     # Calculate the fuzz ratio for each feature string in each reference tuple
-    for i in candidate_indices:
-        feature_strings = reference[i]
-        ratios[i] = [fuzz.ratio(val, query) for val in feature_strings]
+    # in a single call, so that all scores are computed by RapidFuzz
+    # internally; float64 is required for the scores to be truncated exactly
+    # like the return values of individual fuzz.ratio calls
+    candidates = reference[candidate_indices]
+    ratios[candidate_indices] = process.cdist(
+        candidates.ravel(), [query], scorer=fuzz.ratio, dtype=np.float64
+    ).reshape(candidates.shape)
 
     max_ratio = np.max(ratios)
     max_row_ratios = np.max(ratios, axis=1)
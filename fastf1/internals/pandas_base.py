@@ -79,32 +79,39 @@ class BaseDataFrame(pd.DataFrame):
             # force casting of default columns when forcing columns
             _cast_default_cols = True
 
-        super().__init__(*args, **kwargs)
-
         if _cast_default_cols and (self._COLUMNS is not None):
+            # create and cast the data first and only then initialize this
+            # object from it; this allows to cast all columns with a single
+            # call to .astype instead of replacing the columns one by one
+            data = pd.DataFrame(*args, **kwargs)
+            casts = dict()
             for col, _type in self._COLUMNS.items():
-                if col not in self.columns:
+                if col not in data.columns:
                     continue
                 cast = True
-                if self[col].isna().all():
+                if data[col].isna().all():
                     # empty column, set appropriate NA-type
                     if isinstance(_type, str) and not (_type == 'object'):
                         # type given as string, e.g. 'datetime64[ns]'
-                        self[col] = pd.Series(dtype=_type)
+                        data[col] = pd.Series(dtype=_type)
                     elif type(None) in typing.get_args(_type):
                         # type given using typing module and type is marked as
                         # optional, e.g. typing.Optional[int]
-                        self[col] = None
+                        data[col] = None
                         cast = False  # do not cast this column
                     elif (_type == object) or (_type == 'object'):  # noqa: E721, type comparison with ==
                         # object type, set to None
-                        self[col] = None
+                        data[col] = None
                         cast = False
                     else:
-                        self[col] = _type()
+                        data[col] = _type()
 
                 if cast and (type(None) not in typing.get_args(_type)):
-                    self[col] = self[col].astype(_type)
+                    casts[col] = _type
+
+            args, kwargs = (data.astype(casts), ), dict()
+
+        super().__init__(*args, **kwargs)
 
     @property
     def _constructor(self) -> Callable[..., "BaseDataFrame"]:
@@ -155,11 +162,13 @@ class _BaseSeriesConstructor(pd.Series):
     def __new__(cls, data=None, index=None, *args, **kwargs) -> pd.Series:
         parent = getattr(cls, '__meta_created_from', None)
 
+        index_from_data = False
         if (index is None) and isinstance(
                 data, pd.Series | pd.DataFrame | SingleBlockManager):
             # no index is explicitly given, try to get an index from the
             # data itself
             index = getattr(data, 'index', None)
+            index_from_data = True
 
         if (parent is None) or (index is None):
             # do "conventional" slicing and return a pd.Series
@@ -175,6 +184,10 @@ class _BaseSeriesConstructor(pd.Series):
 
         if isinstance(data, SingleBlockManager):
             obj = constructor._from_mgr(data, axes=data.axes)
+        elif index_from_data and isinstance(data, pd.Series):
+            # the index is the one of the data itself, passing it explicitly
+            # would only make pandas reindex and copy the data again
+            obj = constructor(data=data, index=None, *args, **kwargs)
         else:
             obj = constructor(data=data, index=index, *args, **kwargs)
 
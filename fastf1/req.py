@@ -214,6 +214,10 @@ class Cache(metaclass=_MetaCache):
 
     _request_counter = 0  # count uncached requests for debugging purposes
 
+    # functions that clear in-memory caches of other modules, these are called
+    # when the cache is cleared
+    _memory_cache_clear_funcs = list()
+
     @classmethod
     def enable_cache(
             cls, cache_dir: str, ignore_version: bool = False,
@@ -374,6 +378,9 @@ class Cache(metaclass=_MetaCache):
                 cached data.
             deep (bool): Clear the requests cache (stage 1) too.
         """
+        for clear_func in cls._memory_cache_clear_funcs:
+            clear_func()
+
         if cache_dir is None:
             if cls._CACHE_DIR is None:
                 cache_dir = cls._get_default_cache_path()
@@ -1,4 +1,7 @@
+import collections
 import datetime
+import logging
+import time
 
 import pandas as pd
 import pytest
@@ -75,6 +78,193 @@ def test_get_testing_event():
         fastf1.get_testing_event(2021, 2)
 
 
+def test_event_schedule_memoized(monkeypatch):
+    monkeypatch.setattr(fastf1.Cache, '_ci_mode', False)
+    monkeypatch.setattr(fastf1.events, '_schedule_memo',
+                        collections.OrderedDict())
+
+    calls = []
+
+    def _backend(year):
+        calls.append(year)
+        if year == 2019:
+            return None  # failed to load
+        return fastf1.events.EventSchedule(
+            {'EventName': ['T', 'A', 'B'], 'RoundNumber': [0, 1, 2],
+             'EventFormat': ['testing', 'conventional', 'conventional']},
+            year=year, _force_default_cols=True
+        )
+
+    monkeypatch.setattr(fastf1.events, '_get_schedule_ff1', _backend)
+
+    schedule = fastf1.get_event_schedule(2020, backend='fastf1')
+    assert isinstance(schedule, fastf1.events.EventSchedule)
+    assert schedule.year == 2020
+
+    # modifying a returned schedule or event must not modify the memoized
+    # schedule
+    schedule.loc[1, 'EventName'] = 'C'
+    event = fastf1.get_event(2020, 1, backend='fastf1')
+    assert event.EventName == 'A'
+    with pd.option_context('mode.chained_assignment', None):
+        event['EventName'] = 'C'
+    assert fastf1.get_event(2020, 'A', backend='fastf1').EventName == 'A'
+    schedule = fastf1.get_event_schedule(2020, backend='fastf1',
+                                         include_testing=False)
+    assert list(schedule['EventName']) == ['A', 'B']
+    assert calls == [2020]
+
+    # failed loads are not memoized
+    with pytest.raises(ValueError, match="Failed to load"):
+        fastf1.get_event_schedule(2019, backend='fastf1')
+    with pytest.raises(ValueError, match="Failed to load"):
+        fastf1.get_event_schedule(2019, backend='fastf1')
+    assert calls == [2020, 2019, 2019]
+
+
+def test_event_schedule_memo_reload(monkeypatch, tmp_path):
+    monkeypatch.setattr(fastf1.Cache, '_ci_mode', False)
+    monkeypatch.setattr(fastf1.events, '_schedule_memo',
+                        collections.OrderedDict())
+
+    calls = []
+    source_expiry = None
+
+    def _backend(year):
+        calls.append(year)
+        schedule = fastf1.events.EventSchedule(
+            {'EventName': ['T', 'A'], 'RoundNumber': [0, 1],
+             'EventFormat': ['testing', 'conventional']},
+            year=year, _force_default_cols=True
+        )
+        schedule._source_expiry = source_expiry
+        return schedule
+
+    monkeypatch.setattr(fastf1.events, '_get_schedule_ff1', _backend)
+
+    fastf1.get_event_schedule(2020, backend='fastf1')
+    fastf1.get_event_schedule(2020, backend='fastf1')
+    assert calls == [2020]
+
+    # clearing the cache empties the memo
+    fastf1.Cache.clear_cache(str(tmp_path))
+    fastf1.get_event_schedule(2020, backend='fastf1')
+    assert calls == [2020, 2020]
+
+    # the memo is not used if a cache renewal is forced
+    with monkeypatch.context() as m:
+        m.setattr(fastf1.Cache, '_FORCE_RENEW', True)
+        fastf1.get_event_schedule(2020, backend='fastf1')
+        assert calls == [2020, 2020, 2020]
+
+    # the memo expires together with the cached response
+    fastf1.Cache.clear_cache(str(tmp_path))
+    source_expiry = time.monotonic() - 1
+    fastf1.get_event_schedule(2020, backend='fastf1')
+    fastf1.get_event_schedule(2020, backend='fastf1')
+    assert calls == [2020, 2020, 2020, 2020, 2020]
+
+    # events are looked up on the memoized schedule, they are reloaded in
+    # the same cases
+    source_expiry = None
+    fastf1.Cache.clear_cache(str(tmp_path))
+    del calls[:]
+    assert fastf1.get_event(2020, 1, backend='fastf1').EventName == 'A'
+    assert fastf1.get_event(2020, 'A', backend='fastf1').EventName == 'A'
+    assert fastf1.get_testing_event(2020, 1, backend='fastf1') \
+        .EventName == 'T'
+    assert calls == [2020]
+    fastf1.Cache.clear_cache(str(tmp_path))
+    assert fastf1.get_event(2020, 1, backend='fastf1').EventName == 'A'
+    assert calls == [2020, 2020]
+    fastf1.Cache.clear_cache(str(tmp_path))
+    assert fastf1.get_testing_event(2020, 1, backend='fastf1') \
+        .EventName == 'T'
+    assert calls == [2020, 2020, 2020]
+    with monkeypatch.context() as m:
+        m.setattr(fastf1.Cache, '_FORCE_RENEW', True)
+        fastf1.get_event(2020, 1, backend='fastf1')
+        fastf1.get_event(2020, 1, backend='fastf1')
+        assert calls == [2020, 2020, 2020, 2020, 2020]
+
+
+def test_event_schedule_stage2_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(fastf1.Cache, '_ci_mode', False)
+    monkeypatch.setattr(fastf1.Cache, '_CACHE_DIR', str(tmp_path))
+
+    with open('fastf1/testing/reference_data/schedule_2020.json', 'rb') as f:
+        content = f.read()
+
+    class _Response:
+        pass
+
+    response = _Response()
+    response.content = content
+    monkeypatch.setattr(fastf1.Cache, 'requests_get',
+                        lambda *args, **kwargs: response)
+
+    schedule = fastf1.events._get_schedule_ff1(2020)
+    assert (tmp_path / '2020' / 'event_schedule.ff1pkl').is_file()
+
+    # the cached schedule is used as long as the response does not change
+    parsed = []
+    to_timedelta = fastf1.events.to_timedelta
+    monkeypatch.setattr(fastf1.events, 'to_timedelta',
+                        lambda x: parsed.append(x) or to_timedelta(x))
+    cached = fastf1.events._get_schedule_ff1(2020)
+    assert not parsed
+    assert isinstance(cached, fastf1.events.EventSchedule)
+    assert cached.year == 2020
+    pd.testing.assert_frame_equal(cached, schedule)
+
+    # changed response content invalidates the cached schedule
+    response.content = content.replace(b'Austrian', b'Austrian2')
+    updated = fastf1.events._get_schedule_ff1(2020)
+    assert parsed
+    assert 'Austrian2 Grand Prix' in updated['EventName'].values
+
+
+def test_event_schedule_modified_in_place():
+    # lookups on a user-held schedule must reflect in-place modifications
+    def _schedule():
+        return fastf1.events.EventSchedule(
+            {'EventName': ['A', 'B', 'C'], 'RoundNumber': [1, 2, 3],
+             'EventFormat': ['conventional'] * 3},
+            year=2020, _force_default_cols=True
+        )
+
+    schedule = _schedule()
+    assert schedule.get_event_by_round(2).EventName == 'B'
+    schedule.drop(index=0, inplace=True)
+    assert schedule.get_event_by_round(3).EventName == 'C'
+    with pytest.raises(ValueError, match="Invalid round"):
+        schedule.get_event_by_round(1)
+
+    schedule = _schedule()
+    assert schedule.get_event_by_round(1).EventName == 'A'
+    schedule.sort_values('EventName', ascending=False, inplace=True)
+    assert schedule.get_event_by_round(1).EventName == 'A'
+
+    schedule = _schedule()
+    assert schedule.get_event_by_round(1).EventName == 'A'
+    schedule.loc[0, 'RoundNumber'] = 5
+    assert schedule.get_event_by_round(5).EventName == 'A'
+
+    schedule = _schedule()
+    schedule['Location'] = ['Sakhir', 'Melbourne', 'Monza']
+    assert schedule.get_event_by_name('Monza').EventName == 'C'
+    schedule.drop(index=0, inplace=True)
+    assert schedule.get_event_by_name('Melbourne').EventName == 'B'
+    schedule.loc[2, 'Location'] = 'Imola'
+    assert schedule.get_event_by_name('Imola').EventName == 'C'
+
+    schedule = fastf1.events.EventSchedule({'EventName': ['A']}, year=2020,
+                                           _force_default_cols=True)
+    assert schedule._remove_common_words('2021 Grand Prix') == '2021 '
+    schedule.year = 2021
+    assert schedule._remove_common_words('2021 Grand Prix') == ' '
+
+
 def test_event_schedule_partial_data_init():
     schedule = fastf1.events.EventSchedule(
         {'EventName': ['A', 'B', 'C'], 'Session1Date': [None, None, None],
@@ -133,6 +323,20 @@ def test_event_schedule_get_by_name():
     assert schedule.get_event_by_name('test-test').EventName == 'test_test'
 
 
+def test_event_schedule_get_by_name_unique_exact_match(caplog):
+    caplog.set_level(logging.INFO)
+    schedule = fastf1.events.EventSchedule(
+        {
+            'EventName': ['Grand Prix A', 'Grand Prix B'],
+            'Location': ['Austin', 'Austin West']
+        }
+    )
+
+    # query is a substring of both locations but only equal to one
+    assert schedule.get_event_by_name('austin').EventName == 'Grand Prix A'
+    assert "Correcting user input" not in caplog.text
+
+
 def test_event_fuzzy_search():
     # highest overlap case
     schedule = fastf1.get_event_schedule(1979)